@@ -1,6 +1,7 @@
 """Chat endpoints."""
 
 import asyncio
+import importlib.util
 from typing import AsyncGenerator, Optional
 
 from fastapi import APIRouter, Depends, Request
@@ -8,11 +9,16 @@ from fastapi_limiter.depends import RateLimiter
 from pydantic import BaseModel, Field
 
 from app.auth import get_current_user
-from app.models import UserInDB
+from app.models import User
 from app.responses import create_response, create_streaming_response
 
 router = APIRouter()
 
+# Resolved once at import time rather than probing the module spec per request
+WEBSEARCH_AVAILABLE = (
+    importlib.util.find_spec("app.workflows.graphs.websearch") is not None
+)
+
 
 class ChatRequest(BaseModel):
     """Chat request model."""
@@ -55,7 +61,7 @@ async def chat_stream(
     request: Request,
     sleep: float = 1.0,
     number: int = 10,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: User = Depends(get_current_user),
 ) -> dict:
     """Stream chat tokens."""
 
@@ -73,17 +79,11 @@ async def chat_websearch(
     request: Request,
     question: Optional[str] = None,
     thread_id: Optional[str] = None,
-    current_user: UserInDB = Depends(get_current_user),
+    current_user: User = Depends(get_current_user),
 ) -> dict:
     """Stream web search chat response."""
-    # Try to use the actual service, fallback to mock
-    try:
-        # Check if websearch module is available
-        import importlib.util
-
-        spec = importlib.util.find_spec("app.workflows.graphs.websearch")
-        if spec is None:
-            raise ImportError("Websearch module not available")
+    # Use the actual service when available, fallback to mock
+    if WEBSEARCH_AVAILABLE:
 
         async def websearch_stream() -> AsyncGenerator[str, None]:
             yield f"data: Searching for: {question}\n\n"
@@ -91,18 +91,17 @@ async def chat_websearch(
             yield "data: [DONE]\n\n"
 
         return create_streaming_response(websearch_stream(), media_type="text/plain")
-    except ImportError:
 
-        async def mock_stream() -> AsyncGenerator[str, None]:
-            yield f"data: Mock search for: {question}\n\n"
-            yield "data: [DONE]\n\n"
+    async def mock_stream() -> AsyncGenerator[str, None]:
+        yield f"data: Mock search for: {question}\n\n"
+        yield "data: [DONE]\n\n"
 
-        return create_streaming_response(mock_stream(), media_type="text/plain")
+    return create_streaming_response(mock_stream(), media_type="text/plain")
 
 
 @router.post("/summary")
 async def create_summary(
-    request: SummaryRequest, current_user: UserInDB = Depends(get_current_user)
+    request: SummaryRequest, current_user: User = Depends(get_current_user)
 ) -> dict:
     """Submit text for summary task."""
     # Mock implementation
@@ -115,7 +114,7 @@ async def create_summary(
 
 @router.get("/summary/status")
 async def get_summary_status(
-    task_id: Optional[str] = None, current_user: UserInDB = Depends(get_current_user)
+    task_id: Optional[str] = None, current_user: User = Depends(get_current_user)
 ) -> dict:
     """Get status of summary task."""
     result = SummaryResponse(
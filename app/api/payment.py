@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from app.auth import get_current_user
-from app.models import SubscriptionPlan, User
+from app.models import SubscriptionPlan, User, get_subscription_limits
 from app.responses import create_response
 
 router = APIRouter()
@@ -100,8 +100,6 @@ async def create_portal_session(
 @router.get("/plans")
 async def get_subscription_plans() -> dict:
     """Get available subscription plans."""
-    from app.models import get_subscription_limits
-
     plans = []
     for plan in SubscriptionPlan:
         limits = get_subscription_limits(plan)
@@ -124,8 +122,6 @@ async def get_current_subscription(
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """Get current user's subscription details."""
-    from app.models import get_subscription_limits
-
     limits = get_subscription_limits(current_user.subscription_plan)
 
     return create_response(
@@ -1,5 +1,6 @@
 """Research endpoints."""
 
+import tempfile
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -8,7 +9,7 @@ from fastapi_limiter.depends import RateLimiter
 from pydantic import BaseModel
 
 from app.auth import get_current_user
-from app.models import User
+from app.models import SubscriptionInfo, SubscriptionPlan, User
 from app.responses import create_response
 
 router = APIRouter()
@@ -46,8 +47,6 @@ class ResearchService:
         return response, "Saved", 200
 
     async def get_user_subscription(self, user_id: str) -> Any:
-        from app.models import SubscriptionInfo, SubscriptionPlan
-
         return SubscriptionInfo(
             plan=SubscriptionPlan.FREE, searches_used=0, searches_limit=10
         )
@@ -170,8 +169,6 @@ async def export_research(
     if status_code != 200 or content is None:
         raise HTTPException(status_code=status_code, detail=filename)
 
-    import tempfile
-
     with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
         if isinstance(content, str):
             tmp_file.write(content.encode("utf-8"))
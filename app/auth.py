@@ -1,27 +1,64 @@
 """Authentication service and utilities."""
 
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 
+import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from loguru import logger
 from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.cache import cache
+from app.core.config import PasswordScheme, settings
 from app.core.database import get_db
-from app.models import TokenData, UserCreate, UserDB, UserInDB
+from app.models import TokenData, User, UserCreate, UserDB, UserInDB
+
+
+def _build_pwd_context() -> CryptContext:
+    """Build the password hashing context from the security settings."""
+    options: dict = {
+        "bcrypt__default_rounds": settings.BCRYPT_ROUNDS,
+        # Hashes below the configured cost are flagged for rehash on login
+        "bcrypt__min_rounds": settings.BCRYPT_ROUNDS,
+    }
+    schemes = ["bcrypt"]
+    if settings.PASSWORD_SCHEME == PasswordScheme.ARGON2:
+        schemes = ["argon2", "bcrypt"]
+        options["argon2__time_cost"] = settings.ARGON2_TIME_COST
+        options["argon2__memory_cost"] = settings.ARGON2_MEMORY_KB
+
+    # "auto" deprecates every scheme except the first, the one used for new hashes
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
 
 # Security setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = _build_pwd_context()
 security = HTTPBearer()
 
+# Hash prefixes verified with bcrypt directly, bypassing passlib's identify step
+_BCRYPT_PREFIXES = (b"$2a$", b"$2b$")
+
+# Prebuilt single-row lookups, executed with bound parameters per call. They
+# project plain columns so rows skip ORM instance construction.
+_USER_COLUMNS = UserDB.__table__.columns
+_USER_BY_EMAIL = (
+    select(*_USER_COLUMNS).where(UserDB.email == bindparam("email")).limit(1)
+)
+_USER_BY_ID = select(*_USER_COLUMNS).where(UserDB.id == bindparam("user_id")).limit(1)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
+    hashed = hashed_password.encode()
+    if hashed.startswith(_BCRYPT_PREFIXES):
+        # bcrypt only reads 72 bytes; passlib truncates the same way
+        return bcrypt.checkpw(plain_password.encode()[:72], hashed)
     return bool(pwd_context.verify(plain_password, hashed_password))
 
 
@@ -30,20 +67,29 @@ def get_password_hash(password: str) -> str:
     return str(pwd_context.hash(password))
 
 
+def _row_to_user(row: Row) -> UserInDB:
+    """Build a UserInDB from a users row without re-running field validation."""
+    return UserInDB.model_construct(**row._mapping)
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash verified against on unknown emails to keep login timing uniform."""
+    return get_password_hash("dummy-password-for-timing")
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
-    to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.security.access_token_expire_minutes
-        )
+        lifetime = settings.security.access_token_expire_minutes * 60
 
-    to_encode.update({"exp": expire})
+    # JWT NumericDate: integer seconds since the epoch
+    now = int(time.time())
     return str(
         jwt.encode(
-            to_encode,
+            {**data, "iat": now, "exp": now + lifetime},
             settings.security.secret_key,
             algorithm=settings.security.algorithm,
         )
@@ -53,6 +99,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def verify_token(token: str) -> Optional[TokenData]:
     """Verify and decode a JWT token."""
     try:
+        # Cheap header-only check rejects foreign or malformed tokens early
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") != settings.security.algorithm:
+            return None
+
         payload = jwt.decode(
             token,
             settings.security.secret_key,
@@ -79,19 +130,49 @@ async def authenticate_user(
     email: str, password: str, db: AsyncSession
 ) -> Optional[UserInDB]:
     """Authenticate a user."""
-    result = await db.execute(select(UserDB).where(UserDB.email == email))
-    user = result.scalar_one_or_none()
+    result = await db.execute(_USER_BY_EMAIL, {"email": email})
+    row = result.first()
 
-    if user and verify_password(password, str(user.hashed_password)):
-        return UserInDB.model_validate(user, from_attributes=True)
-    return None
+    if row is None:
+        # Run a hash check anyway so unknown emails can't be told apart by timing
+        verify_password(password, _dummy_password_hash())
+        return None
+
+    if not verify_password(password, row.hashed_password):
+        return None
+
+    user = _row_to_user(row)
+    if pwd_context.needs_update(row.hashed_password):
+        user.hashed_password = await _rehash_password(
+            row.id, password, row.hashed_password, db
+        )
+    return user
+
+
+async def _rehash_password(
+    user_id: int, password: str, current_hash: str, db: AsyncSession
+) -> str:
+    """Upgrade a stored hash to the configured scheme and cost."""
+    new_hash = get_password_hash(password)
+    try:
+        await db.execute(
+            update(UserDB).where(UserDB.id == user_id).values(hashed_password=new_hash)
+        )
+        await db.commit()
+        await invalidate_user_cache(user_id)
+        logger.info(f"Rehashed password for user {user_id}")
+        return new_hash
+    except Exception as e:
+        logger.error(f"Error rehashing password for user {user_id}: {e}")
+        await db.rollback()
+        return current_hash
 
 
 async def create_user(user_create: UserCreate, db: AsyncSession) -> UserInDB:
     """Create a new user."""
     # Check if user already exists
-    result = await db.execute(select(UserDB).where(UserDB.email == user_create.email))
-    if result.scalar_one_or_none():
+    result = await db.execute(_USER_BY_EMAIL, {"email": user_create.email})
+    if result.first() is not None:
         raise ValueError("Email already registered")
 
     # Create new user
@@ -113,22 +194,63 @@ async def create_user(user_create: UserCreate, db: AsyncSession) -> UserInDB:
 
 async def get_user_by_email(email: str, db: AsyncSession) -> Optional[UserInDB]:
     """Get a user by email."""
-    result = await db.execute(select(UserDB).where(UserDB.email == email))
-    user = result.scalar_one_or_none()
-    return UserInDB.model_validate(user, from_attributes=True) if user else None
+    result = await db.execute(_USER_BY_EMAIL, {"email": email})
+    row = result.first()
+    return _row_to_user(row) if row else None
 
 
 async def get_user_by_id(user_id: int, db: AsyncSession) -> Optional[UserInDB]:
     """Get a user by ID."""
-    result = await db.execute(select(UserDB).where(UserDB.id == user_id))
-    user = result.scalar_one_or_none()
-    return UserInDB.model_validate(user, from_attributes=True) if user else None
+    result = await db.execute(_USER_BY_ID, {"user_id": user_id})
+    row = result.first()
+    return _row_to_user(row) if row else None
+
+
+def _user_cache_key(user_id: int) -> str:
+    """Cache key for a user looked up during authentication."""
+    return f"auth_user:{user_id}"
+
+
+async def get_cached_user_by_id(user_id: int, db: AsyncSession) -> Optional[User]:
+    """Get a user by ID, serving repeat lookups from a short-lived cache.
+
+    The password hash is never cached or returned.
+    """
+    ttl = settings.USER_CACHE_TTL
+    key = _user_cache_key(user_id)
+    if ttl > 0:
+        try:
+            cached = await cache.get(key)
+            if cached is not None:
+                return User.model_validate(cached)
+        except Exception as e:
+            logger.warning(f"User cache read failed for user {user_id}: {e}")
+
+    user_in_db = await get_user_by_id(user_id, db)
+    if user_in_db is None:
+        return None
+
+    data = user_in_db.model_dump(mode="json", exclude={"hashed_password"})
+    if ttl > 0:
+        try:
+            await cache.set(key, data, ttl=ttl)
+        except Exception as e:
+            logger.warning(f"User cache write failed for user {user_id}: {e}")
+    return User.model_validate(data)
+
+
+async def invalidate_user_cache(user_id: int) -> None:
+    """Drop a cached user so the next lookup reads the database."""
+    try:
+        await cache.delete(_user_cache_key(user_id))
+    except Exception as e:
+        logger.warning(f"User cache invalidation failed for user {user_id}: {e}")
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> UserInDB:
+) -> User:
     """Get the current authenticated user."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -137,27 +259,11 @@ async def get_current_user(
     )
 
     token_data = verify_token(credentials.credentials)
-    if token_data is None or token_data.email is None:
+    if token_data is None or token_data.user_id is None or token_data.email is None:
         raise credentials_exception
 
-    user = await get_user_by_email(token_data.email, db)
+    user = await get_cached_user_by_id(token_data.user_id, db)
     if user is None:
         raise credentials_exception
 
     return user
-
-
-async def increment_user_searches(user_id: int, db: AsyncSession) -> bool:
-    """Increment user's search count."""
-    try:
-        result = await db.execute(select(UserDB).where(UserDB.id == user_id))
-        user = result.scalar_one_or_none()
-        if user:
-            user.searches_used_this_month = user.searches_used_this_month + 1  # type: ignore[assignment]
-            await db.commit()
-            logger.info(f"Incremented searches for user {user_id}")
-            return True
-    except Exception as e:
-        logger.error(f"Error incrementing searches for user {user_id}: {e}")
-        await db.rollback()
-    return False
@@ -49,6 +49,13 @@ class SearchProvider(str, enum.Enum):
     TAVILY = "tavily"
 
 
+class PasswordScheme(str, enum.Enum):
+    """Supported password hashing schemes."""
+
+    BCRYPT = "bcrypt"
+    ARGON2 = "argon2"
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration settings."""
 
@@ -123,6 +130,27 @@ class SearchConfig(BaseModel):
         description="Maximum delay for exponential backoff",
     )
     timeout: int = Field(default=30, ge=5, le=120, description="Search request timeout")
+    concurrency: int = Field(
+        default=3, ge=1, le=20, description="Maximum concurrent search queries"
+    )
+    circuit_threshold: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Consecutive failed searches before the circuit opens",
+    )
+    circuit_cooldown: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description="Seconds searches are short-circuited once the circuit opens",
+    )
+    cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        le=86400,
+        description="Seconds to cache results per query (0 disables)",
+    )
 
 
 class SecurityConfig(BaseModel):
@@ -141,6 +169,24 @@ class SecurityConfig(BaseModel):
     password_min_length: int = Field(
         default=8, ge=6, le=128, description="Minimum password length"
     )
+    password_scheme: PasswordScheme = Field(
+        default=PasswordScheme.BCRYPT, description="Password hashing scheme"
+    )
+    bcrypt_rounds: int = Field(
+        default=12, ge=4, le=31, description="bcrypt cost factor (log2 rounds)"
+    )
+    argon2_time_cost: int = Field(
+        default=3, ge=1, le=10, description="Argon2 number of iterations"
+    )
+    argon2_memory_kb: int = Field(
+        default=65536, ge=8192, le=1048576, description="Argon2 memory cost in KiB"
+    )
+    user_cache_ttl: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Seconds to cache authenticated user lookups (0 disables)",
+    )
 
 
 class AppConfig(BaseSettings):
@@ -292,6 +338,22 @@ class AppConfig(BaseSettings):
     def SEARCH_TIMEOUT(self) -> int:
         return self.search_timeout
 
+    @property
+    def SEARCH_CONCURRENCY(self) -> int:
+        return self.search.concurrency
+
+    @property
+    def SEARCH_CIRCUIT_THRESHOLD(self) -> int:
+        return self.search.circuit_threshold
+
+    @property
+    def SEARCH_CIRCUIT_COOLDOWN(self) -> float:
+        return self.search.circuit_cooldown
+
+    @property
+    def SEARCH_CACHE_TTL(self) -> int:
+        return self.search.cache_ttl
+
     @property
     def SECRET_KEY(self) -> str:
         return self.security.secret_key
@@ -308,6 +370,26 @@ class AppConfig(BaseSettings):
     def REFRESH_TOKEN_EXPIRE_DAYS(self) -> int:
         return self.security.refresh_token_expire_days
 
+    @property
+    def PASSWORD_SCHEME(self) -> PasswordScheme:
+        return self.security.password_scheme
+
+    @property
+    def BCRYPT_ROUNDS(self) -> int:
+        return self.security.bcrypt_rounds
+
+    @property
+    def ARGON2_TIME_COST(self) -> int:
+        return self.security.argon2_time_cost
+
+    @property
+    def ARGON2_MEMORY_KB(self) -> int:
+        return self.security.argon2_memory_kb
+
+    @property
+    def USER_CACHE_TTL(self) -> int:
+        return self.security.user_cache_ttl
+
     @property
     def STRIPE_SECRET_KEY(self) -> str:
         return self.stripe_secret_key
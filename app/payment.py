@@ -1,5 +1,6 @@
 """Payment service for Stripe integration."""
 
+import asyncio
 from typing import Optional
 
 from loguru import logger
@@ -13,6 +14,8 @@ if settings.stripe_secret_key:
         import stripe
 
         stripe.api_key = settings.stripe_secret_key
+        # Let the SDK retry 409/429/5xx with backoff and generated idempotency keys
+        stripe.max_network_retries = 5
         USE_STRIPE = True
     except ImportError:
         USE_STRIPE = False
@@ -31,7 +34,9 @@ class PaymentService:
             return f"cus_mock_{email.replace('@', '_').replace('.', '_')}"
 
         try:
-            customer = stripe.Customer.create(
+            # stripe-python 7.x is synchronous; keep its HTTP round-trip off the loop
+            customer = await asyncio.to_thread(
+                stripe.Customer.create,
                 email=email,
                 name=name,
                 metadata={"source": "ai_research_platform"},
@@ -58,7 +63,8 @@ class PaymentService:
         try:
             plan_limits = get_subscription_limits(plan)
 
-            session = stripe.checkout.Session.create(
+            session = await asyncio.to_thread(
+                stripe.checkout.Session.create,
                 customer=customer_id,
                 payment_method_types=["card"],
                 line_items=[
@@ -91,7 +97,8 @@ class PaymentService:
             return mock_url
 
         try:
-            session = stripe.billing_portal.Session.create(
+            session = await asyncio.to_thread(
+                stripe.billing_portal.Session.create,
                 customer=customer_id,
                 return_url=return_url,
             )
@@ -41,4 +41,5 @@ def create_streaming_response(
     headers: Optional[Dict[str, str]] = None,
 ) -> StreamingResponse:
     """Create a streaming response."""
-    return StreamingResponse(content, media_type=media_type, headers=headers or {})
+    # StreamingResponse accepts None headers, so there's no need for an empty dict
+    return StreamingResponse(content, media_type=media_type, headers=headers)
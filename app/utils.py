@@ -1,19 +1,26 @@
 """Essential utility functions."""
 
 import hashlib
-import json
 import re
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# C0 and C1 control characters, dropped via str.translate
+_CTRL_TABLE = dict.fromkeys([*range(0x20), *range(0x7F, 0xA0)])
+
 
 def generate_cache_key(*args: Any, **kwargs: Any) -> str:
     """Generate a consistent cache key from arguments."""
-    sorted_kwargs = sorted(kwargs.items())
-    data = (args, sorted_kwargs)
-    return hashlib.sha256(
-        json.dumps(data, default=str, sort_keys=True).encode()
-    ).hexdigest()
+    payload = orjson.dumps(
+        [args, kwargs],
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def sanitize_url(url: str) -> str:
@@ -50,10 +57,7 @@ def clean_text(text: str) -> str:
         return ""
 
     # Remove extra whitespace and control characters
-    text = re.sub(r"\s+", " ", text.strip())
-    text = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", text)
-
-    return text
+    return _WHITESPACE_RE.sub(" ", text.strip()).translate(_CTRL_TABLE)
 
 
 def validate_email(email: str) -> bool:
@@ -61,5 +65,4 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
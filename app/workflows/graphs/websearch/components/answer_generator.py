@@ -3,7 +3,6 @@
 from datetime import datetime
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
 from langgraph.config import get_stream_writer
 from loguru import logger
 
@@ -13,6 +12,10 @@ from app.workflows.graphs.websearch.model_map import LLMModelMap
 from app.workflows.graphs.websearch.prompts import RAG_PROMPT, SYSTEM_PROMPT
 from app.workflows.graphs.websearch.states import AgentState
 
+NO_CONTEXT_ANSWER = (
+    "The context does not contain enough information to answer the question."
+)
+
 
 class AnswerGenerator:
     """Agent component responsible for synthesizing a final answer from retrieved web content."""
@@ -32,19 +35,23 @@ class AnswerGenerator:
     def generate(self, state: AgentState) -> dict[str, list[AIMessage]]:
         """Generates an answer using retrieved web content and the user's refined question."""
         web_results = state["search_results"]
-        result_blocks = {}
-        combined_content = ""
+        result_blocks: dict[str, dict] = {}
+        parts: list[str] = []
 
-        cnt = 1
         for result in web_results:
             content = result.get("content")
             if content is not None:
-                result_blocks[str(cnt)] = result
-                cnt += 1
+                key = str(len(result_blocks) + 1)
+                result_blocks[key] = result
+                parts.append(f"{key}. {content.strip()}\n\n")
+
+        combined_content = "".join(parts)
 
-        for key, result in result_blocks.items():
-            content = result.get("content", "").strip()
-            combined_content += f"{key}. {content}\n\n"
+        # Nothing to ground an answer in; reply as the system prompt instructs
+        # without spending a model call
+        if not result_blocks:
+            logger.warning("No search results with content; skipping answer generation")
+            return {"messages": [AIMessage(content=NO_CONTEXT_ANSWER)]}
 
         # Stream citation
         writer = get_stream_writer()
@@ -79,18 +86,12 @@ class AnswerGenerator:
             f"Generating answer with {'local' if settings.USE_LOCAL_MODEL else 'OpenAI'} model..."
         )
 
-        if settings.USE_LOCAL_MODEL:
-            answer_content_obj = self.llm.invoke(conversation)
-            if hasattr(answer_content_obj, "content"):
-                answer_content = str(answer_content_obj.content)
-            else:
-                answer_content = str(answer_content_obj)
-        else:
-            prompt = ChatPromptTemplate.from_messages(conversation)
-            answer = self.llm.invoke(prompt.format_messages())
-            answer_content = (
-                str(answer.content) if hasattr(answer, "content") else str(answer)
-            )
+        # The messages are already final; rebuilding a ChatPromptTemplate from them
+        # only copied them again before every call
+        answer = self.llm.invoke(conversation)
+        answer_content = (
+            str(answer.content) if hasattr(answer, "content") else str(answer)
+        )
 
         logger.info(f"Final Answer Generated:\n{answer_content}")
 
@@ -56,19 +56,21 @@ class QuestionRewriter:
             return {"messages": [RemoveMessage(id=str(m.id)) for m in to_remove]}
         return {"messages": messages}
 
+    @staticmethod
+    def recent_messages(state: AgentState) -> list:
+        """Returns the last 10 messages of the conversation for prompt construction."""
+        return state["messages"][-10:]
+
     def rewrite(self, state: AgentState) -> dict:
         """Rewrites the question using chat history for context."""
-        conversation = state["messages"][:-1] if len(state["messages"]) > 1 else []
-        conversation = self.delete_messages(state=state)["messages"]
-
         current_question = state["question"].content
-        conversation.insert(
-            0,
+        conversation = [
             SystemMessage(
                 content="You are a helpful assistant that rephrases the user's question to be a standalone question optimized for websearch.",
             ),
-        )
-        conversation.append(HumanMessage(content=current_question))
+            *self.recent_messages(state),
+            HumanMessage(content=current_question),
+        ]
 
         logger.info(
             f"Rewriting question with {'local' if settings.USE_LOCAL_MODEL else 'OpenAI'} model..."
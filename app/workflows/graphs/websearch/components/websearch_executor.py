@@ -2,11 +2,13 @@
 
 import asyncio
 import random
-from typing import Any, List
+from typing import Any, List, Optional
 
 from loguru import logger
 
 from app import settings
+from app.core.cache import cache
+from app.utils import generate_cache_key
 from app.workflows.graphs.websearch.states import AgentState
 from app.workflows.graphs.websearch.tools import SEARCH_TOOL
 
@@ -26,6 +28,125 @@ class WebSearchExecutor:
         jitter = random.uniform(0, 0.1 * delay)
         return float(delay + jitter)
 
+    def _cache_key(self, query: str) -> str:
+        """Build the cache key for a query and result count."""
+        return f"search:{generate_cache_key(query.strip().lower(), self.max_results)}"
+
+    async def _get_cached_results(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Return cached results for a query, or None on miss or cache error."""
+        if settings.SEARCH_CACHE_TTL <= 0:
+            return None
+        try:
+            cached: Optional[list[dict[str, Any]]] = await cache.get(key)
+            return cached
+        except Exception as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+
+    async def _set_cached_results(self, key: str, items: list[dict[str, Any]]) -> None:
+        """Cache processed results for a query."""
+        if settings.SEARCH_CACHE_TTL <= 0:
+            return
+        try:
+            await cache.set(key, items, ttl=settings.SEARCH_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    async def _search_query(self, query: str) -> Optional[list[dict[str, Any]]]:
+        """Search a single query with retries; returns None if every attempt fails."""
+        if not query or not query.strip():
+            logger.warning("Skipping empty query")
+            return []
+
+        cache_key = self._cache_key(query)
+        cached_results = await self._get_cached_results(cache_key)
+        if cached_results is not None:
+            logger.info(f"Using cached web search results for: '{query}'")
+            return cached_results
+
+        logger.info(f"Performing web search for: '{query}'")
+
+        # Tools that retry inside their own time budget get a single attempt:
+        # DuckDuckGo searches in a worker thread that a timeout cannot cancel,
+        # so retrying here would stack a second retry loop on the first
+        if getattr(SEARCH_TOOL, "retries_internally", False):
+            attempts = 1
+        else:
+            attempts = self._max_retries
+
+        # Try multiple times for each query
+        for attempt in range(attempts):
+            try:
+                # Add delay between retries
+                if attempt > 0:
+                    delay = self._exponential_backoff_delay(attempt)
+                    logger.info(
+                        f"Retrying search for '{query}' (attempt {attempt + 1}/{attempts}) after {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+
+                # Invoke the search tool with max_results parameter
+                search_response = await asyncio.wait_for(
+                    SEARCH_TOOL.ainvoke(
+                        {"query": query, "max_results": self.max_results}
+                    ),
+                    timeout=settings.SEARCH_TIMEOUT,
+                )
+
+                # Handle different response formats
+                if isinstance(search_response, dict):
+                    if "error" in search_response:
+                        logger.warning(
+                            f"Search tool returned error for '{query}': {search_response['error']}"
+                        )
+                        if attempt < attempts - 1:
+                            continue
+                        return None
+
+                    search_results = search_response.get("results", [])
+                else:
+                    # Handle case where tool returns results directly
+                    search_results = (
+                        search_response if isinstance(search_response, list) else []
+                    )
+
+                # Process each result
+                query_results = []
+                for item in search_results:
+                    if isinstance(item, dict):
+                        try:
+                            # Ensure we have the required fields
+                            processed_item = {
+                                "title": item.get("title", "Untitled"),
+                                "link": item.get("link", ""),
+                                "content": item.get("content", item.get("body", "")),
+                                "source": item.get("source", "Unknown"),
+                            }
+                            # Only add if we have content
+                            if processed_item["content"]:
+                                query_results.append(processed_item)
+                        except Exception as e:
+                            logger.warning(f"Error processing search result: {e}")
+                            continue
+
+                logger.info(
+                    f"Successfully processed {len(query_results)} results for query: '{query}'"
+                )
+                if query_results:
+                    await self._set_cached_results(cache_key, query_results)
+                return query_results
+
+            except Exception as e:
+                error_msg = str(e)
+                logger.warning(
+                    f"Error during web search for query '{query}' (attempt {attempt + 1}): {error_msg}"
+                )
+
+                if attempt == attempts - 1:
+                    logger.error(f"All retries failed for query '{query}': {error_msg}")
+
+        return None
+
     async def search(self, state: AgentState) -> dict[str, list[dict[str, Any]]]:
         """Executes web search queries using available questions in the state with robust error handling."""
         # Handle both enhanced questions (from question_enhancer) and single refined question (from question_rewriter)
@@ -62,92 +183,33 @@ class WebSearchExecutor:
         )
         questions = flat_questions
 
-        results = []
-        failed_queries = []
-
+        # Enhanced questions often overlap; search each distinct query once
+        seen: set[str] = set()
+        unique_questions: List[str] = []
         for query in questions:
-            if not query or not query.strip():
-                logger.warning("Skipping empty query")
+            normalized = query.strip().lower()
+            if normalized in seen:
                 continue
+            seen.add(normalized)
+            unique_questions.append(query)
+        questions = unique_questions
 
-            logger.info(f"Performing web search for: '{query}'")
-
-            # Try multiple times for each query
-            for attempt in range(self._max_retries):
-                try:
-                    # Add delay between retries
-                    if attempt > 0:
-                        delay = self._exponential_backoff_delay(attempt)
-                        logger.info(
-                            f"Retrying search for '{query}' (attempt {attempt + 1}/{self._max_retries}) after {delay:.2f}s"
-                        )
-                        await asyncio.sleep(delay)
-
-                    # Invoke the search tool with max_results parameter
-                    search_response = await asyncio.wait_for(
-                        SEARCH_TOOL.ainvoke(
-                            {"query": query, "max_results": self.max_results}
-                        ),
-                        timeout=settings.SEARCH_TIMEOUT,
-                    )
-
-                    # Handle different response formats
-                    if isinstance(search_response, dict):
-                        if "error" in search_response:
-                            logger.warning(
-                                f"Search tool returned error for '{query}': {search_response['error']}"
-                            )
-                            if attempt < self._max_retries - 1:
-                                continue
-                            failed_queries.append(query)
-                            break
-
-                        search_results = search_response.get("results", [])
-                    else:
-                        # Handle case where tool returns results directly
-                        search_results = (
-                            search_response if isinstance(search_response, list) else []
-                        )
+        # Queries are independent; run them together under the concurrency cap
+        semaphore = asyncio.Semaphore(settings.SEARCH_CONCURRENCY)
 
-                    # Process each result
-                    query_results = []
-                    for item in search_results:
-                        if isinstance(item, dict):
-                            try:
-                                # Ensure we have the required fields
-                                processed_item = {
-                                    "title": item.get("title", "Untitled"),
-                                    "link": item.get("link", ""),
-                                    "content": item.get(
-                                        "content", item.get("body", "")
-                                    ),
-                                    "source": item.get("source", "Unknown"),
-                                }
-                                # Only add if we have content
-                                if processed_item["content"]:
-                                    query_results.append(processed_item)
-                            except Exception as e:
-                                logger.warning(f"Error processing search result: {e}")
-                                continue
+        async def run(query: str) -> Optional[list[dict[str, Any]]]:
+            async with semaphore:
+                return await self._search_query(query)
 
-                    logger.info(
-                        f"Successfully processed {len(query_results)} results for query: '{query}'"
-                    )
-                    results.extend(query_results)
-                    break  # Success, exit retry loop
+        outcomes = await asyncio.gather(*(run(query) for query in questions))
 
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.warning(
-                        f"Error during web search for query '{query}' (attempt {attempt + 1}): {error_msg}"
-                    )
-
-                    if attempt == self._max_retries - 1:
-                        logger.error(
-                            f"All retries failed for query '{query}': {error_msg}"
-                        )
-                        failed_queries.append(query)
-                    continue
+        results = []
+        failed_queries = []
+        for query, query_results in zip(questions, outcomes):
+            if query_results is None:
+                failed_queries.append(query)
+            else:
+                results.extend(query_results)
 
         # Log summary
         total_queries = len(questions)
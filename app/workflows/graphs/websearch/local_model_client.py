@@ -1,9 +1,11 @@
 """Enhanced local model client for Ollama integration with robust error handling."""
 
 import json
+import random
 import re
 import time
-from typing import Any, Dict, List, Optional, Type, TypeVar, cast
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, cast
 
 from langchain_core.messages import BaseMessage
 from langchain_openai import ChatOpenAI
@@ -15,6 +17,64 @@ from app.exceptions import ServiceUnavailableError
 
 T = TypeVar("T", bound=BaseModel)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Error message fragments that indicate a transient failure worth retrying
+_RETRYABLE_ERROR_RE = re.compile(
+    "|".join(
+        (
+            "timeout",
+            "connection",
+            "network",
+            "temporary",
+            "service unavailable",
+            "gateway",
+            "bad gateway",
+            "internal server error",
+            "rate limit",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=128)
+def _field_patterns(
+    schema: Type[BaseModel],
+) -> Tuple[Tuple[str, Any, Tuple[re.Pattern[str], ...]], ...]:
+    """Compile each field's key-value patterns once, alongside its annotation."""
+    return tuple(
+        (
+            field,
+            info.annotation,
+            tuple(
+                re.compile(pattern, re.IGNORECASE)
+                for pattern in (
+                    rf"{field}:\s*([^\n]+)",
+                    rf"{field}\s*=\s*([^\n]+)",
+                    rf'"{field}":\s*("[^"]+")',
+                    rf'"{field}":\s*([^,\s\}}]+)',
+                )
+            ),
+        )
+        for field, info in schema.model_fields.items()
+    )
+
+
+@lru_cache(maxsize=128)
+def _field_lookup(schema: Type[BaseModel]) -> Dict[str, str]:
+    """Map lowercased field names of a schema to their canonical names."""
+    return {field.lower(): field for field in schema.model_fields}
+
+
+@lru_cache(maxsize=128)
+def _value_patterns(schema: Type[BaseModel]) -> Dict[str, re.Pattern[str]]:
+    """Compile the inline value pattern for each field of a schema once."""
+    return {
+        field: re.compile(rf"{field.lower()}[:\s]+([^\n,;]+)", re.IGNORECASE)
+        for field in schema.model_fields
+    }
+
 
 class LocalModelClient:
     """Enhanced client for interacting with local Ollama model with robust error handling."""
@@ -46,24 +106,12 @@ class LocalModelClient:
     def _exponential_backoff_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay with jitter."""
         delay = min(self.retry_delay * (2**attempt), 10.0)
-        jitter = time.time() % 0.1 * delay
+        jitter = random.uniform(0, 0.1 * delay)
         return float(delay + jitter)
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if an error is retryable."""
-        error_str = str(error).lower()
-        retryable_patterns = [
-            "timeout",
-            "connection",
-            "network",
-            "temporary",
-            "service unavailable",
-            "gateway",
-            "bad gateway",
-            "internal server error",
-            "rate limit",
-        ]
-        return any(pattern in error_str for pattern in retryable_patterns)
+        return _RETRYABLE_ERROR_RE.search(str(error)) is not None
 
     def invoke(self, messages: List[BaseMessage]) -> str:
         """Invoke the local model with messages and retry logic."""
@@ -82,9 +130,17 @@ class LocalModelClient:
                     time.sleep(delay)
 
                 response = self.client.invoke(messages)
-                content = str(response.content)  # Ensure content is string
+                raw_content = response.content
+                if isinstance(raw_content, str):
+                    content = raw_content
+                else:
+                    # Join the text of multi-part content blocks
+                    content = "".join(
+                        block if isinstance(block, str) else block.get("text", "")
+                        for block in raw_content
+                    )
 
-                if not content or content.strip() == "":
+                if not content or content.isspace():
                     logger.warning("Empty response from local model")
                     return "I apologize, but I received an empty response. Please try again."
 
@@ -136,17 +192,20 @@ class LocalModelClient:
         content = content.strip()
 
         # Strategy 1: Try to extract JSON directly
-        try:
-            # Look for JSON object in the response
-            json_match = re.search(
-                r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", content, re.DOTALL
-            )
-            if json_match:
-                json_str = json_match.group()
-                data = json.loads(json_str)
+        start = content.find("{")
+        end = content.rfind("}")
+        if 0 <= start < end:
+            try:
+                # Pydantic parses and validates the JSON span in one pass
+                return schema.model_validate_json(content[start : end + 1])
+            except ValidationError as e:
+                logger.debug(f"JSON parsing failed: {e}")
+            # Trailing prose may contain braces; decode just the first object
+            try:
+                data, _ = _JSON_DECODER.raw_decode(content, start)
                 return schema.model_validate(data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            logger.debug(f"JSON parsing failed: {e}")
+            except (json.JSONDecodeError, ValidationError) as e:
+                logger.debug(f"JSON object decoding failed: {e}")
 
         # Strategy 2: Try to extract key-value pairs
         try:
@@ -175,24 +234,15 @@ class LocalModelClient:
     def _extract_key_value_pairs(self, content: str, schema: Type[T]) -> Dict[str, Any]:
         """Extract key-value pairs from text content."""
         data: Dict[str, Any] = {}
-        schema_fields = list(schema.model_fields.keys())
 
         # Look for patterns like "key: value" or "key = value"
-        for field in schema_fields:
-            patterns = [
-                rf"{field}:\s*([^\n]+)",
-                rf"{field}\s*=\s*([^\n]+)",
-                rf'"{field}":\s*("[^"]+")',
-                rf'"{field}":\s*([^,\s\}}]+)',
-            ]
-
+        for field, field_type, patterns in _field_patterns(schema):
             for pattern in patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+                match = pattern.search(content)
                 if match:
                     value = match.group(1).strip()
                     # Try to convert to appropriate type
                     try:
-                        field_type = schema.model_fields[field].annotation
                         if field_type is bool:
                             data[field] = cast(
                                 Any, bool(value.lower() in ("true", "yes", "1"))
@@ -212,22 +262,21 @@ class LocalModelClient:
     def _extract_from_markdown(self, content: str, schema: Type[T]) -> Dict[str, Any]:
         """Extract structured data from markdown-like format."""
         data: Dict[str, Any] = {}
-        schema_fields = list(schema.model_fields.keys())
+        field_lookup = _field_lookup(schema)
 
-        # Look for markdown headers and lists
-        lines = content.split("\n")
+        # Look for markdown headers and lists in a single pass over the lines
         current_field = None
 
-        for line in lines:
+        for line in content.split("\n"):
             line = line.strip()
             if not line:
                 continue
 
-            # Check for headers
-            for field in schema_fields:
-                if re.match(rf"^#+\s*{field}", line, re.IGNORECASE):
-                    current_field = field
-                    break
+            # Check for headers: the first word after the #'s names the field
+            if line[0] == "#":
+                words = line.lstrip("#").partition(":")[0].split(maxsplit=1)
+                if words and words[0].lower() in field_lookup:
+                    current_field = field_lookup[words[0].lower()]
 
             # Check for list items
             if current_field and line.startswith(("-", "*", "•")):
@@ -237,36 +286,35 @@ class LocalModelClient:
                 data[current_field].append(value)
 
             # Check for key-value in line
-            for field in schema_fields:
-                if f"{field}:" in line.lower():
-                    value = line.split(":", 1)[1].strip()
-                    data[field] = value
-                    break
+            key, sep, value = line.partition(":")
+            if sep:
+                field = field_lookup.get(key.strip(" #-*•").lower())
+                if field:
+                    data[field] = value.strip()
 
         return data
 
     def _infer_from_content(self, content: str, schema: Type[T]) -> Dict[str, Any]:
         """Infer structured data from content using heuristics."""
         data: Dict[str, Any] = {}
-        schema_fields = list(schema.model_fields.keys())
+        value_patterns = _value_patterns(schema)
 
         # Simple heuristics based on content
         content_lower = content.lower()
 
-        for field in schema_fields:
+        for field_lower, field in _field_lookup(schema).items():
             # Look for field mentions in content
-            if field.lower() in content_lower:
-                # Extract surrounding text as value
-                field_index = content_lower.find(field.lower())
-                start = max(0, field_index - 50)
-                end = min(len(content), field_index + len(field) + 50)
-                context = content[start:end]
-
-                # Try to extract value from context
-                value_match = re.search(
-                    rf"{field.lower()}[:\s]+([^\n,;]+)", context, re.IGNORECASE
-                )
-                if value_match:
-                    data[field] = value_match.group(1).strip()
+            field_index = content_lower.find(field_lower)
+            if field_index < 0:
+                continue
+
+            # Extract surrounding text as value
+            start = max(0, field_index - 50)
+            end = min(len(content), field_index + len(field) + 50)
+
+            # Try to extract value from context
+            value_match = value_patterns[field].search(content, start, end)
+            if value_match:
+                data[field] = value_match.group(1).strip()
 
         return data
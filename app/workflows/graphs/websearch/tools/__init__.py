@@ -7,19 +7,17 @@ from app import settings
 # Import DuckDuckGo tool always
 from .duckduckgo_search_tool import DUCKDUCKGO_SEARCH_TOOL
 
-# Conditionally import Tavily tool only if needed
-if settings.SEARCH_PROVIDER.lower() == "tavily":
-    from .tavily_search_tool import TAVILY_SEARCH_TOOL
+_USE_TAVILY = settings.SEARCH_PROVIDER.lower() == "tavily"
 
-SEARCH_TOOL: BaseTool = (
-    TAVILY_SEARCH_TOOL
-    if settings.SEARCH_PROVIDER.lower() == "tavily"
-    else DUCKDUCKGO_SEARCH_TOOL
-)
+__all__ = ["DUCKDUCKGO_SEARCH_TOOL", "SEARCH_TOOL", "TOOLS"]
 
-TOOLS: list[BaseTool] = [SEARCH_TOOL]
+# Import Tavily tool only if needed, and only export it then
+if _USE_TAVILY:
+    from .tavily_search_tool import TAVILY_SEARCH_TOOL
 
-__all__ = ["DUCKDUCKGO_SEARCH_TOOL", "SEARCH_TOOL", "TOOLS"]
-# Only export TAVILY_SEARCH_TOOL if imported
-if settings.SEARCH_PROVIDER.lower() == "tavily":
+    SEARCH_TOOL: BaseTool = TAVILY_SEARCH_TOOL
     __all__.append("TAVILY_SEARCH_TOOL")
+else:
+    SEARCH_TOOL = DUCKDUCKGO_SEARCH_TOOL
+
+TOOLS: list[BaseTool] = [SEARCH_TOOL]
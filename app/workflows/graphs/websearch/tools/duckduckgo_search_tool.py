@@ -1,16 +1,94 @@
 """DuckDuckGo search tool for websearch."""
 
+import asyncio
 import random
+import re
+import threading
 import time
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Optional
 
 from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException, TimeoutException
 from langchain_core.tools import BaseTool
 from loguru import logger
 from pydantic import BaseModel, Field
 
 from app import settings
 
+# Error message fragments that indicate a transient failure worth retrying
+_RETRYABLE_ERROR_RE = re.compile(
+    "|".join(
+        (
+            "rate limit",
+            "ratelimit",
+            "429",
+            "too many requests",
+            "timeout",
+            "connection",
+            "network",
+            "temporary",
+            "service unavailable",
+            "gateway",
+            "bad gateway",
+            "internal server error",
+            "ddgs",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Exception types that are always transient, checked before the message
+_RETRYABLE_ERROR_TYPES = (
+    RatelimitException,
+    TimeoutException,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+# DDGS calls block; a small dedicated pool keeps slow or abandoned searches from
+# starving other asyncio.to_thread users of the default executor
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.SEARCH_CONCURRENCY, thread_name_prefix="duckduckgo"
+)
+
+# Seconds the tool's own deadline stays under the caller's SEARCH_TIMEOUT, so
+# the retry loop finishes before the caller stops waiting on its thread
+_DEADLINE_MARGIN = 2.0
+
+# DDGS's own per-request timeout, capped further by the search time budget
+_DDGS_REQUEST_TIMEOUT = 10
+
+
+class _CircuitBreaker:
+    """Process-wide breaker that pauses searches after repeated failures."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= settings.SEARCH_CIRCUIT_THRESHOLD:
+                self._open_until = time.monotonic() + settings.SEARCH_CIRCUIT_COOLDOWN
+                self._failures = 0
+                logger.warning(
+                    f"DuckDuckGo circuit opened for {settings.SEARCH_CIRCUIT_COOLDOWN}s"
+                )
+
+
+_CIRCUIT = _CircuitBreaker()
+
 
 class SearchInput(BaseModel):
     """Input schema for DuckDuckGo search tool."""
@@ -26,6 +104,10 @@ class DuckDuckGoSearchTool(BaseTool):
     description: str = "Search the web using DuckDuckGo"
     max_results: int = Field(default=10, description="Maximum number of search results")
 
+    # Retries, backoff and the circuit breaker all live in _run, bounded by
+    # SEARCH_TIMEOUT, so callers should make a single attempt
+    retries_internally: ClassVar[bool] = True
+
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
         self._ddgs: Optional[DDGS] = None  # Initialize lazily
@@ -33,52 +115,55 @@ class DuckDuckGoSearchTool(BaseTool):
         self._max_retries = settings.SEARCH_MAX_RETRIES
         self._base_delay = settings.SEARCH_BASE_DELAY
         self._max_delay = settings.SEARCH_MAX_DELAY
+        self._time_budget = settings.SEARCH_TIMEOUT - _DEADLINE_MARGIN
+        self._request_timeout = max(
+            1, min(_DDGS_REQUEST_TIMEOUT, int(self._time_budget))
+        )
 
     @property
     def ddgs(self) -> DDGS:
         """Lazy initialization of DDGS instance."""
         if self._ddgs is None:
             try:
-                self._ddgs = DDGS()
+                self._ddgs = DDGS(timeout=self._request_timeout)
             except Exception as e:
                 logger.error(f"Failed to initialize DDGS: {e}")
                 raise
         return self._ddgs
 
     def _exponential_backoff_delay(self, attempt: int) -> float:
-        """Calculate exponential backoff delay with jitter."""
-        delay = min(self._base_delay * (2**attempt), self._max_delay)
-        jitter = random.uniform(0, 0.1 * delay)
-        return float(delay + jitter)
+        """Calculate exponential backoff delay with full jitter."""
+        # Spreading retries over the whole window keeps concurrent searches from
+        # hitting DuckDuckGo's rate limiter in lockstep
+        cap = min(self._base_delay * (2**attempt), self._max_delay)
+        return random.uniform(0, cap)
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if an error is retryable."""
-        error_str = str(error).lower()
-        retryable_patterns = [
-            "rate limit",
-            "too many requests",
-            "timeout",
-            "connection",
-            "network",
-            "temporary",
-            "service unavailable",
-            "gateway",
-            "bad gateway",
-            "internal server error",
-            "ddgs",
-        ]
-        return any(pattern in error_str for pattern in retryable_patterns)
+        if isinstance(error, _RETRYABLE_ERROR_TYPES):
+            return True
+        return _RETRYABLE_ERROR_RE.search(str(error)) is not None
 
     def _run(self, query: str, max_results: int = 10) -> dict[str, Any]:
         """Execute DuckDuckGo search with robust retry logic and fallback mechanisms."""
+        # A blank query can never succeed; don't spend the retry budget on it
+        if not query or not query.strip():
+            logger.warning("Skipping DuckDuckGo search for empty query")
+            return self._create_fallback_response(query, "Empty query")
+
+        # DuckDuckGo is failing for everyone; don't add to the retry storm
+        if _CIRCUIT.is_open():
+            return self._create_fallback_response(
+                query, "Search temporarily unavailable"
+            )
+
+        deadline = time.monotonic() + self._time_budget
+        last_error: Optional[str] = None
+
         # Use provided max_results or fall back to instance default
         search_max_results = (
             max_results if max_results is not None else self.max_results
         )
-        logger.info(
-            f"DuckDuckGo search tool called with query='{query}', max_results={max_results}, using search_max_results={search_max_results}"
-        )
-        logger.info(f"Tool instance max_results: {self.max_results}")
 
         # Ensure max_results is an integer
         try:
@@ -89,29 +174,31 @@ class DuckDuckGoSearchTool(BaseTool):
             )
             search_max_results = self.max_results
 
-        # Limit results to the requested max_results
-        logger.info(f"Will limit results to {search_max_results} items")
-
         for attempt in range(self._max_retries):
             try:
-                logger.info(
-                    f"Performing DuckDuckGo search for: '{query}' with max_results={search_max_results} (attempt {attempt + 1}/{self._max_retries})"
-                )
-
-                # Add exponential backoff delay between retries
+                # Add exponential backoff delay between retries, giving up once
+                # another attempt could overrun the search time budget
                 if attempt > 0:
                     delay = self._exponential_backoff_delay(attempt)
+                    if time.monotonic() + delay + self._request_timeout > deadline:
+                        break
                     logger.info(f"Waiting {delay:.2f}s before retry {attempt + 1}")
                     time.sleep(delay)
 
+                # Arguments are only formatted when DEBUG logging is enabled
+                logger.debug(
+                    "DuckDuckGo search for '{}' with max_results={} (attempt {}/{})",
+                    query,
+                    search_max_results,
+                    attempt + 1,
+                    self._max_retries,
+                )
+
                 # Perform the search with timeout
                 start_time = time.time()
-                logger.info(
-                    f"Calling DuckDuckGo with query='{query}' and max_results={search_max_results}"
-                )
-                results = list(self.ddgs.text(query, max_results=search_max_results))
+                results = self.ddgs.text(query, max_results=search_max_results)
                 search_time = time.time() - start_time
-                logger.info(f"DuckDuckGo returned {len(results)} raw results")
+                logger.debug("DuckDuckGo returned {} raw results", len(results))
 
                 # Validate results
                 if not results:
@@ -122,34 +209,24 @@ class DuckDuckGoSearchTool(BaseTool):
                         continue
                     return self._create_fallback_response(query, "No results found")
 
-                # Transform results to match Tavily format
-                formatted_results = []
-                for result in results:
-                    try:
-                        formatted_result = {
-                            "title": result.get("title", "Untitled"),
-                            "link": result.get("link", ""),
-                            "content": result.get("body", ""),
-                            "source": "DuckDuckGo",
-                        }
-                        # Only add results with content
-                        if formatted_result["content"]:
-                            formatted_results.append(formatted_result)
-                    except Exception as e:
-                        logger.warning(f"Error formatting result: {e}")
-                        continue
-
-                # Limit results to the requested max_results
-                if len(formatted_results) > search_max_results:
-                    logger.info(
-                        f"Limiting results from {len(formatted_results)} to {search_max_results}"
-                    )
-                    formatted_results = formatted_results[:search_max_results]
+                # Transform results to match Tavily format, keeping only results
+                # with content; DDGS returns the URL under "href"
+                formatted_results = [
+                    {
+                        "title": result.get("title", "Untitled"),
+                        "link": result.get("href", ""),
+                        "content": result["body"],
+                        "source": "DuckDuckGo",
+                    }
+                    for result in results[:search_max_results]
+                    if result.get("body")
+                ]
 
                 logger.info(
-                    f"DuckDuckGo search completed successfully with {len(formatted_results)} results in {search_time:.2f}s"
+                    f"DuckDuckGo search for '{query}' returned {len(formatted_results)} results in {search_time:.2f}s (attempts={attempt + 1})"
                 )
 
+                _CIRCUIT.record_success()
                 return {
                     "results": formatted_results,
                     "query": query,
@@ -159,7 +236,7 @@ class DuckDuckGoSearchTool(BaseTool):
                 }
 
             except Exception as e:
-                error_msg = str(e)
+                error_msg = last_error = str(e)
                 logger.warning(
                     f"DuckDuckGo search error (attempt {attempt + 1}): {error_msg}"
                 )
@@ -176,14 +253,29 @@ class DuckDuckGoSearchTool(BaseTool):
                     logger.error(
                         f"All {self._max_retries} retries failed for DuckDuckGo search: {error_msg}"
                     )
+                    _CIRCUIT.record_failure()
                     return self._create_fallback_response(
                         query, f"All retries failed: {error_msg}"
                     )
 
+                # Another search may have tripped the breaker while this one waited
+                if _CIRCUIT.is_open():
+                    return self._create_fallback_response(
+                        query, "Search temporarily unavailable"
+                    )
+
                 continue
 
-        # This should never be reached, but add explicit return for safety
-        return self._create_fallback_response(query, "Unexpected end of retry loop")
+        # Only reached when the time budget cuts the retries short
+        logger.error(
+            f"DuckDuckGo search for '{query}' ran out of time after {attempt} attempts"
+        )
+        if last_error is None:
+            return self._create_fallback_response(query, "No results found")
+        _CIRCUIT.record_failure()
+        return self._create_fallback_response(
+            query, f"Search time budget exhausted: {last_error}"
+        )
 
     def _create_fallback_response(self, query: str, error_msg: str) -> dict[str, Any]:
         """Create a fallback response when search fails."""
@@ -198,7 +290,11 @@ class DuckDuckGoSearchTool(BaseTool):
 
     async def _arun(self, query: str, max_results: int = 10) -> dict[str, Any]:
         """Async version of the search."""
-        return self._run(query, max_results)
+        # DDGS and the retry backoff are blocking; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _SEARCH_EXECUTOR, self._run, query, max_results
+        )
 
 
 # Create the DuckDuckGo search tool instance
@@ -1,6 +1,7 @@
 """Enhanced entry point to run the application with improved error handling and graceful shutdown."""
 
 import multiprocessing
+import os
 import signal
 import subprocess
 import sys
@@ -12,8 +13,17 @@ from app.core.config import AppEnvs, settings
 
 
 def calculate_worker_count() -> int:
-    """Calculate optimal worker count: 2 * CPU cores + 1."""
-    return multiprocessing.cpu_count() * 2 + 1
+    """Calculate optimal worker count: 2 * usable CPU cores + 1.
+
+    Counts only the CPUs this process may run on (e.g. a container's cpuset).
+    CPU quotas are not visible here, so set WORKER_COUNT explicitly when
+    deploying under a cgroup CPU limit.
+    """
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        cpu_count = multiprocessing.cpu_count()
+    return cpu_count * 2 + 1
 
 
 def setup_signal_handlers() -> None:
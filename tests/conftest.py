@@ -5,7 +5,9 @@ import asyncio
 import fakeredis.aioredis
 import pytest
 import pytest_asyncio
+from asgi_lifespan import LifespanManager
 from fastapi_limiter import FastAPILimiter
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.core.database import Base, get_db
@@ -16,11 +18,25 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:?cache=shared"
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Hash test passwords at bcrypt's minimum cost instead of production cost."""
+    from app import auth
+    from app.core.config import settings
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings.security, "bcrypt_rounds", 4)
+        mp.setattr(auth, "pwd_context", auth._build_pwd_context())
+        yield
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
@@ -70,3 +86,21 @@ async def setup_test_environment():
     await FastAPILimiter.close()
     await engine.dispose()
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Run the app lifespan once and share one HTTP client across tests."""
+    async with LifespanManager(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            # Warm up routing and response serialization before the first test
+            await client.get("/health")
+            yield client
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session():
+    """Yield a session bound to the test database."""
+    async for session in app.dependency_overrides[get_db]():
+        yield session
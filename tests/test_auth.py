@@ -0,0 +1,96 @@
+"""Authentication service tests."""
+
+import uuid
+
+import pytest
+from sqlalchemy import update
+
+from app import auth
+from app.core.cache import cache
+from app.core.config import settings
+from app.models import User, UserCreate, UserDB
+
+PASSWORD = "testpass123"
+
+
+async def create_test_user(db_session):
+    """Register a user with a unique email."""
+    return await auth.create_user(
+        UserCreate(
+            email=f"auth-{uuid.uuid4()}@example.com",
+            full_name="Auth User",
+            password=PASSWORD,
+        ),
+        db_session,
+    )
+
+
+async def use_stale_password_hash(monkeypatch, user_id, db_session):
+    """Store a hash below the configured bcrypt cost so login rehashes it."""
+    stale_hash = auth.pwd_context.hash(PASSWORD)
+    monkeypatch.setattr(settings.security, "bcrypt_rounds", settings.BCRYPT_ROUNDS + 1)
+    monkeypatch.setattr(auth, "pwd_context", auth._build_pwd_context())
+    await db_session.execute(
+        update(UserDB).where(UserDB.id == user_id).values(hashed_password=stale_hash)
+    )
+    await db_session.commit()
+    return stale_hash
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cached_user_omits_password_hash(db_session):
+    """Cached user lookups never store or return the password hash."""
+    user = await create_test_user(db_session)
+
+    cached_user = await auth.get_cached_user_by_id(user.id, db_session)
+
+    assert type(cached_user) is User
+    cached = await cache.get(auth._user_cache_key(user.id))
+    assert cached["email"] == user.email
+    assert "hashed_password" not in cached
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cached_user_is_served_until_invalidated(db_session):
+    """Repeat lookups hit the cache until the entry is invalidated."""
+    user = await create_test_user(db_session)
+    await auth.get_cached_user_by_id(user.id, db_session)
+
+    # A write that bypasses the service helpers is not seen while cached
+    await db_session.execute(
+        update(UserDB).where(UserDB.id == user.id).values(searches_used_this_month=5)
+    )
+    await db_session.commit()
+    cached_user = await auth.get_cached_user_by_id(user.id, db_session)
+    assert cached_user.searches_used_this_month == 0
+
+    await auth.invalidate_user_cache(user.id)
+    assert await cache.get(auth._user_cache_key(user.id)) is None
+    fresh_user = await auth.get_cached_user_by_id(user.id, db_session)
+    assert fresh_user.searches_used_this_month == 5
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rehash_on_login_invalidates_cached_user(db_session, monkeypatch):
+    """Upgrading a stale hash at login drops the cached user."""
+    user = await create_test_user(db_session)
+    await use_stale_password_hash(monkeypatch, user.id, db_session)
+    await auth.get_cached_user_by_id(user.id, db_session)
+
+    assert await auth.authenticate_user(user.email, PASSWORD, db_session)
+    assert await cache.get(auth._user_cache_key(user.id)) is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_login_upgrades_stale_password_hash(db_session, monkeypatch):
+    """Logging in with a hash below the configured cost stores a rehashed one."""
+    user = await create_test_user(db_session)
+    stale_hash = await use_stale_password_hash(monkeypatch, user.id, db_session)
+
+    assert await auth.authenticate_user(user.email, PASSWORD, db_session)
+
+    stored = await auth.get_user_by_email(user.email, db_session)
+    assert stored.hashed_password != stale_hash
+    assert stored.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    assert not auth.pwd_context.needs_update(stored.hashed_password)
+    assert auth.verify_password(PASSWORD, stored.hashed_password)
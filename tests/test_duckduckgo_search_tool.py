@@ -0,0 +1,51 @@
+"""DuckDuckGo search tool tests."""
+
+import pytest
+from duckduckgo_search.exceptions import RatelimitException
+
+from app import settings
+from app.workflows.graphs.websearch.tools import duckduckgo_search_tool
+
+
+class RateLimitedDDGS:
+    """DDGS stand-in whose searches are always rate limited."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def text(self, query, max_results=None):
+        self.calls += 1
+        raise RatelimitException("429 Ratelimit")
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    """A search tool with no backoff delay and a fresh circuit breaker."""
+    monkeypatch.setattr(
+        duckduckgo_search_tool, "_CIRCUIT", duckduckgo_search_tool._CircuitBreaker()
+    )
+    search_tool = duckduckgo_search_tool.DuckDuckGoSearchTool()
+    search_tool._base_delay = 0
+    search_tool._ddgs = RateLimitedDDGS()
+    return search_tool
+
+
+def test_rate_limited_search_spends_the_retry_budget(tool):
+    """A rate-limited search retries up to SEARCH_MAX_RETRIES, then falls back."""
+    response = tool._run("rate limited query")
+
+    assert tool._ddgs.calls == settings.SEARCH_MAX_RETRIES
+    assert response["fallback"] is True
+    assert response["error"].startswith("All retries failed")
+
+
+def test_circuit_opens_after_threshold(tool):
+    """Once enough searches fail, later ones return without calling DuckDuckGo."""
+    for _ in range(settings.SEARCH_CIRCUIT_THRESHOLD):
+        tool._run("rate limited query")
+    calls = tool._ddgs.calls
+
+    response = tool._run("rate limited query")
+
+    assert tool._ddgs.calls == calls
+    assert response["error"] == "Search temporarily unavailable"
@@ -0,0 +1,123 @@
+"""Web search executor tests."""
+
+import asyncio
+import uuid
+
+import pytest
+
+from app import settings
+from app.workflows.graphs.websearch.components import websearch_executor
+from app.workflows.graphs.websearch.components.websearch_executor import (
+    WebSearchExecutor,
+)
+
+
+class FakeSearchTool:
+    """Search tool stand-in that records queries and peak concurrency."""
+
+    def __init__(self):
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, tool_input):
+        query = tool_input["query"]
+        self.queries.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {
+            "results": [
+                {
+                    "title": query,
+                    "link": "https://example.com",
+                    "content": f"About {query}",
+                    "source": "Fake",
+                }
+            ]
+        }
+
+
+@pytest.fixture
+def search_tool(monkeypatch):
+    """Route executor searches to a fake tool."""
+    tool = FakeSearchTool()
+    monkeypatch.setattr(websearch_executor, "SEARCH_TOOL", tool)
+    return tool
+
+
+def unique_query(text):
+    """A query no other test has cached."""
+    return f"{text} {uuid.uuid4()}"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_duplicate_queries_are_searched_once(search_tool):
+    """Queries differing only in case or whitespace share one search."""
+    query = unique_query("python asyncio")
+    state = {"refined_questions": [query, f"  {query.upper()} ", [query]]}
+
+    result = await WebSearchExecutor().search(state)
+
+    assert search_tool.queries == [query]
+    assert len(result["search_results"]) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cached_results_skip_the_search_tool(search_tool):
+    """A repeated query is served from the cache."""
+    state = {"refined_question": unique_query("cached query")}
+    executor = WebSearchExecutor()
+
+    first = await executor.search(state)
+    second = await executor.search(state)
+
+    assert len(search_tool.queries) == 1
+    assert second == first
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_queries_run_concurrently_under_the_cap(search_tool, monkeypatch):
+    """Distinct queries overlap, but never beyond SEARCH_CONCURRENCY."""
+    monkeypatch.setattr(settings.search, "concurrency", 2)
+    queries = [unique_query(f"query {i}") for i in range(5)]
+
+    result = await WebSearchExecutor().search({"refined_questions": queries})
+
+    assert sorted(search_tool.queries) == sorted(queries)
+    assert search_tool.max_in_flight == 2
+    assert len(result["search_results"]) == 5
+
+
+class HangingSearchTool:
+    """Search tool stand-in that never answers before the timeout."""
+
+    def __init__(self, retries_internally):
+        self.retries_internally = retries_internally
+        self.calls = 0
+
+    async def ainvoke(self, tool_input):
+        self.calls += 1
+        await asyncio.sleep(1)
+
+
+@pytest.mark.parametrize(
+    ("retries_internally", "expected_calls"),
+    [(False, settings.SEARCH_MAX_RETRIES), (True, 1)],
+)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_timeouts_are_retried_only_by_the_owning_layer(
+    monkeypatch, retries_internally, expected_calls
+):
+    """Timed-out searches are retried here unless the tool retries itself."""
+    tool = HangingSearchTool(retries_internally)
+    monkeypatch.setattr(websearch_executor, "SEARCH_TOOL", tool)
+    monkeypatch.setattr(settings, "search_timeout", 0.01)
+    executor = WebSearchExecutor()
+    executor._base_delay = 0
+
+    result = await executor.search({"refined_question": unique_query("slow query")})
+
+    assert tool.calls == expected_calls
+    assert result["search_results"] == []